@@ -39,6 +39,7 @@ import org.bitcoinj.core.FilteredBlock;
 import org.bitcoinj.core.InsufficientMoneyException;
 import org.bitcoinj.core.NetworkParameters;
 import org.bitcoinj.core.Peer;
+import org.bitcoinj.core.Sha256Hash;
 import org.bitcoinj.core.StoredBlock;
 import org.bitcoinj.core.Transaction;
 import org.bitcoinj.core.VerificationException;
@@ -83,12 +84,13 @@ public class Network extends WalletAppKit {
     private final SimpleIntegerProperty peerCount = new SimpleIntegerProperty(0);
 
     /**
-     * Transactions we've been notified of, either via onCoinsSent() or
+     * IDs of transactions we've been notified of, either via onCoinsSent() or
      * onCoinsReceived(). Used so we can filter out transactions that fire both
      * events (i.e. a transaction that pays out, but also has change paying back
-     * to us).
+     * to us). Keyed by the cached transaction hash rather than the transaction
+     * itself, so the set does not pin full transactions in memory.
      */
-    private final Set<Transaction> seenTransactions = new HashSet<>();
+    private final Set<Sha256Hash> seenTransactions = new HashSet<>();
 
     private final Executor networkExecutor;
     private final MonetaryFormat monetaryFormatter;
@@ -115,7 +117,7 @@ public class Network extends WalletAppKit {
         addListener(new Service.Listener() {
             @Override
             public void running() {
-                estimatedBalance.set(monetaryFormatter.format(wallet().getBalance(Wallet.BalanceType.ESTIMATED)).toString());
+                updateEstimatedBalance();
                 try {
                     blocks.set(store().getChainHead().getHeight());
                 } catch (BlockStoreException ex) {
@@ -153,34 +155,42 @@ public class Network extends WalletAppKit {
     }
 
     protected void onCoinsReceived(Wallet wallet, final Transaction tx, final Coin prevBalance, final Coin newBalance) {
-        if (seenTransactions.add(tx)) {
+        if (seenTransactions.add(tx.getHash())) {
             controller.addTransaction(Network.this, tx, prevBalance, newBalance);
         }
-        estimatedBalance.set(monetaryFormatter.format(wallet().getBalance(Wallet.BalanceType.ESTIMATED)).toString());
+        updateEstimatedBalance();
     }
 
     protected void onCoinsSent(Wallet wallet, final Transaction tx, final Coin prevBalance, final Coin newBalance) {
-        if (seenTransactions.add(tx)) {
+        if (seenTransactions.add(tx.getHash())) {
             controller.addTransaction(Network.this, tx, prevBalance, newBalance);
         }
-        estimatedBalance.set(monetaryFormatter.format(wallet().getBalance(Wallet.BalanceType.ESTIMATED)).toString());
+        updateEstimatedBalance();
         // TODO: Update the displayed receive address
     }
 
     protected void onReorganize(Wallet wallet) {
-        estimatedBalance.set(monetaryFormatter.format(wallet().getBalance(Wallet.BalanceType.ESTIMATED)).toString());
+        updateEstimatedBalance();
         controller.refreshTransactions(Network.this, wallet);
     }
 
     protected void onTransactionConfidenceChanged(Wallet wallet, Transaction tx) {
-        estimatedBalance.set(monetaryFormatter.format(wallet().getBalance(Wallet.BalanceType.ESTIMATED)).toString());
+        updateEstimatedBalance();
     }
 
     protected void onWalletChanged(Wallet wallet) {
-        estimatedBalance.set(monetaryFormatter.format(wallet().getBalance(Wallet.BalanceType.ESTIMATED)).toString());
+        updateEstimatedBalance();
         controller.refreshTransactions(Network.this, wallet);
     }
 
+    /**
+     * Recalculate the estimated balance from the wallet and push the formatted
+     * value into the balance property.
+     */
+    private void updateEstimatedBalance() {
+        estimatedBalance.set(monetaryFormatter.format(wallet().getBalance(Wallet.BalanceType.ESTIMATED)).toString());
+    }
+
     @Override
     protected void onSetupCompleted() {
         peerGroup().setConnectTimeoutMillis(1000);
@@ -225,7 +235,7 @@ public class Network extends WalletAppKit {
      * Format a coin amount.
      */
     public CharSequence format(Coin amount) {
-        return params.getMonetaryFormat().format(amount);
+        return monetaryFormatter.format(amount);
     }
 
     /**
@@ -246,8 +256,10 @@ public class Network extends WalletAppKit {
             final long timeout, final TimeUnit timeUnit) {
         this.networkExecutor.execute((Runnable) () -> {
             final Wallet wallet = wallet();
+            // Check the cheap wallet state first; key derivation is expensive
+            // and only worth doing on an encrypted wallet.
             if (!wallet.isEncrypted()) {
-                onCrypterError.accept(null);
+                onWalletNotEncrypted.accept(null);
             } else {
                 final KeyCrypter keyCrypter = wallet().getKeyCrypter();
 
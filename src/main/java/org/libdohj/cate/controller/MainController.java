@@ -19,15 +19,15 @@ import java.io.File;
 import java.io.IOException;
 import java.util.concurrent.ExecutorService;
 import java.util.concurrent.Executors;
+import java.util.concurrent.ScheduledExecutorService;
+import java.util.concurrent.ScheduledFuture;
 import java.util.concurrent.TimeUnit;
 import java.util.ArrayList;
-import java.util.Collections;
+import java.util.Arrays;
 import java.util.HashMap;
 import java.util.Map;
 import java.util.List;
 import java.util.Optional;
-import java.util.SortedSet;
-import java.util.TreeSet;
 import java.util.ResourceBundle;
 
 import com.sun.deploy.uitoolkit.impl.fx.HostServicesFactory;
@@ -55,7 +55,6 @@ import javafx.stage.WindowEvent;
 import javafx.util.StringConverter;
 
 import com.google.common.util.concurrent.Service;
-import javafx.event.EventType;
 
 import org.controlsfx.control.NotificationPane;
 import org.libdohj.cate.CATE;
@@ -72,7 +71,6 @@ import org.bitcoinj.core.TransactionInput;
 import org.bitcoinj.core.TransactionOutPoint;
 import org.bitcoinj.core.TransactionOutput;
 import org.bitcoinj.crypto.KeyCrypterException;
-import org.bitcoinj.crypto.KeyCrypterScrypt;
 import org.bitcoinj.wallet.SendRequest;
 import org.bitcoinj.wallet.Wallet;
 
@@ -90,6 +88,7 @@ public class MainController {
 
     private static final int BANNER_DISPLAY_MILLIS = 3000;
     private static final int NETWORK_PUSH_TIMEOUT_MILLIS = 500;
+    private static final long AES_KEY_CACHE_MILLIS = 5 * 60 * 1000;
 
     @FXML // ResourceBundle that was given to the FXMLLoader
     private ResourceBundle resources;
@@ -136,7 +135,20 @@ public class MainController {
     private final ObservableList<Network> activeNetworks = FXCollections.observableArrayList();
     private final ObservableList<WalletTransaction> transactions = FXCollections.observableArrayList();
     private final Map<Network, NetworkDetail> networkDetails = new HashMap<>();
-    private KeyCrypterScrypt keyCrypter;
+
+    /**
+     * Timer used to hide the notification banner. Shared across banners so
+     * that showing a new banner resets the hide timeout, instead of spawning
+     * a new thread per notification.
+     */
+    private final ScheduledExecutorService bannerTimer
+            = Executors.newSingleThreadScheduledExecutor(runnable -> {
+                final Thread thread = new Thread(runnable, "banner timer");
+                thread.setDaemon(true);
+                return thread;
+            });
+    /** Pending task hiding the current banner, if any. UI thread access only. */
+    private ScheduledFuture<?> bannerHideFuture = null;
 
     private final Logger logger = LoggerFactory.getLogger(MainController.class);
     private CATE cate;
@@ -511,10 +523,8 @@ public class MainController {
      * @param req send request to execute
      */
     private void doSendCoins(final Network network, final SendRequest req) {
-        // Prompt for password if the wallet is encrypted
-        // TODO: Should have an unlock() method we call here,
-        // and uses cached password for ~5 minutes, rather than prompting every
-        // time
+        // Prompt for password if the wallet is encrypted and no key has been
+        // cached recently
         if (network.getEncryptedStateProperty().getValue()) {
             req.aesKey = getAESKeyFromUser(network);
             if (req.aesKey == null) {
@@ -549,6 +559,9 @@ public class MainController {
                     // sufficient to cover a payment, but cannot spend them until
                     // they have confirmed.
                     Platform.runLater(() -> {
+                        // The cached key failed to unlock the wallet, so don't
+                        // hand it out again
+                        invalidateCachedKey(network);
                         Alert alert = new Alert(Alert.AlertType.WARNING);
                         alert.setTitle(resources.getString("doSendCoins.walletLocked.title"));
                         alert.setHeaderText(resources.getString("doSendCoins.walletLocked.head"));
@@ -566,25 +579,27 @@ public class MainController {
      */
     private void showTopBannerOnUIThread(String text) {
         notificationPane.setText(text);
-        notificationPane.getStyleClass().add(NotificationPane.STYLE_CLASS_DARK);
+        if (!notificationPane.getStyleClass().contains(NotificationPane.STYLE_CLASS_DARK)) {
+            notificationPane.getStyleClass().add(NotificationPane.STYLE_CLASS_DARK);
+        }
         notificationPane.show();
-        // TODO: We should have a single persistent thread that does this, and
-        // handles resetting the timer if a new banner is shown before the old is
-        // hidden
-        new Thread(() -> {
-            try {
-                Thread.sleep(BANNER_DISPLAY_MILLIS);
-            } catch (InterruptedException ex) {
-                // Ignore
-            }
+        if (bannerHideFuture != null) {
+            bannerHideFuture.cancel(false);
+        }
+        bannerHideFuture = bannerTimer.schedule(() -> {
             Platform.runLater(() -> {
                 notificationPane.hide();
             });
-        }).start();
+        }, BANNER_DISPLAY_MILLIS, TimeUnit.MILLISECONDS);
     }
 
     private KeyParameter getAESKeyFromUser(final Network network) {
-        // TODO: Cache the key for ~5 minutes
+        final NetworkDetail detail = networkDetails.get(network);
+        final long now = System.currentTimeMillis();
+
+        if (detail.aesKey != null && (now - detail.aesKeyTime) < AES_KEY_CACHE_MILLIS) {
+            return copyKey(detail.aesKey);
+        }
 
         // I don't like that we have to hold the password as a string, so we
         // can't wipe the values once we're done.
@@ -595,12 +610,33 @@ public class MainController {
         // the evaluation
         final Optional<String> password = passwordDialog.showAndWait();
         if (password.isPresent()) {
-            return network.getKeyFromPassword(password.get());
+            final KeyParameter key = network.getKeyFromPassword(password.get());
+            detail.aesKey = key;
+            detail.aesKeyTime = now;
+            return copyKey(key);
         } else {
             return null;
         }
     }
 
+    /**
+     * Copy a key parameter. Network.sendCoins() zeroes the key it is handed
+     * once the request completes, so the cached key must not be passed out
+     * directly.
+     */
+    private static KeyParameter copyKey(final KeyParameter key) {
+        return new KeyParameter(Arrays.copyOf(key.getKey(), key.getKey().length));
+    }
+
+    /**
+     * Forget any cached AES key for the given network, for example because it
+     * failed to unlock the wallet. MUST be called on the UI thread.
+     */
+    private void invalidateCachedKey(final Network network) {
+        final NetworkDetail detail = networkDetails.get(network);
+        detail.aesKey = null;
+    }
+
     /**
      * Register a wallet to be tracked by this controller. This recalculates
      * wallet transactions, which is a long running task, and must be run on a
@@ -612,7 +648,6 @@ public class MainController {
         // main transaction list later.
         final List<WalletTransaction> tempTransactions = rebuildTransactions(network, wallet);
 
-        Collections.reverse(tempTransactions);
         Platform.runLater(() -> {
             this.activeNetworks.add(network);
             if (this.activeNetworks.size() == 1) {
@@ -658,6 +693,7 @@ public class MainController {
         // Stop any further event handling from occurring
         receiveSelector.setOnAction(null);
         sendButton.setOnAction(null);
+        bannerTimer.shutdownNow();
         
         final Alert alert = new Alert(Alert.AlertType.INFORMATION, resources.getString("alert.shuttingDown"));
         alert.setTitle(resources.getString("alert.shuttingDown.title"));
@@ -733,31 +769,33 @@ public class MainController {
         // main transaction list later.
         final List<WalletTransaction> tempTransactions = new ArrayList<>();
 
-        // Pre-sort transactions by date
-        final SortedSet<Transaction> rawTransactions = new TreeSet<>(
-                (Transaction a, Transaction b) -> a.getUpdateTime().compareTo(b.getUpdateTime())
-        );
-        rawTransactions.addAll(wallet.getTransactions(false));
+        // Pre-sort transactions by date. This is done in a plain list rather
+        // than a TreeSet, as a TreeSet compares via its comparator and would
+        // silently drop transactions sharing an update time.
+        final List<Transaction> rawTransactions = new ArrayList<>(wallet.getTransactions(false));
+        rawTransactions.sort((Transaction a, Transaction b) -> a.getUpdateTime().compareTo(b.getUpdateTime()));
 
-        final Map<TransactionOutPoint, Coin> balances = new HashMap<>();
+        // Balances are tracked as long satoshis; Coin is immutable so working
+        // on raw values avoids allocating a new object per balance update.
+        final Map<TransactionOutPoint, Long> balances = new HashMap<>();
         for (Transaction tx : rawTransactions) {
             long valueChange = 0;
             for (TransactionInput in : tx.getInputs()) {
-                Coin balance = balances.get(in.getOutpoint());
+                Long balance = balances.get(in.getOutpoint());
                 // Spend the value on the listed input
                 if (balance != null) {
-                    valueChange -= balance.value;
+                    valueChange -= balance;
                     balances.remove(in.getOutpoint());
                 }
             }
             for (TransactionOutput out : tx.getOutputs()) {
                 if (out.isMine(wallet)) {
                     valueChange += out.getValue().value;
-                    Coin balance = balances.get(out.getOutPointFor());
+                    Long balance = balances.get(out.getOutPointFor());
                     if (balance == null) {
-                        balance = out.getValue();
+                        balance = out.getValue().value;
                     } else {
-                        balance.add(out.getValue());
+                        balance = balance + out.getValue().value;
                     }
                     balances.put(out.getOutPointFor(), balance);
                 }
@@ -765,7 +803,6 @@ public class MainController {
             tempTransactions.add(new WalletTransaction(network, tx, Coin.valueOf(valueChange)));
         }
 
-        Collections.reverse(tempTransactions);
         return tempTransactions;
     }
 
@@ -784,6 +821,10 @@ public class MainController {
     private class NetworkDetail extends Object {
         private StringProperty statusProperty;
         private ExecutorService executor;
+        /** Cached wallet AES key, so the user is not prompted on every send. */
+        private KeyParameter aesKey;
+        /** Time at which the cached AES key was derived. */
+        private long aesKeyTime;
 
         private NetworkDetail(final ExecutorService executor, final StringProperty statusProperty) {
            this.executor = executor;
@@ -22,7 +22,6 @@ import javafx.beans.property.StringProperty;
 import org.bitcoinj.core.Coin;
 import org.bitcoinj.core.NetworkParameters;
 import org.bitcoinj.core.Transaction;
-import org.bitcoinj.utils.MonetaryFormat;
 import org.libdohj.cate.Network;
 import org.libdohj.cate.util.NetworkResolver;
 
@@ -33,6 +32,14 @@ import org.libdohj.cate.util.NetworkResolver;
  * @author Ross Nicoll
  */
 public class WalletTransaction extends Object {
+    /**
+     * Shared date formatter; DateFormat is not thread safe, so access is
+     * synchronized on the instance. Transactions are constructed both on the
+     * UI thread and on wallet registration threads.
+     */
+    private static final DateFormat DATE_FORMAT
+            = DateFormat.getDateTimeInstance(DateFormat.SHORT, DateFormat.SHORT);
+
     private final Network network;
     private final Transaction transaction;
     private final Coin balanceChange;
@@ -40,17 +47,18 @@ public class WalletTransaction extends Object {
     private final ReadOnlyStringProperty dateProperty;
     private final ReadOnlyStringProperty amountProperty;
     private final StringProperty memoProperty;
-    private final DateFormat dateFormat;
 
     protected WalletTransaction(final Network network, final Transaction transaction, final Coin balanceChange) {
         this.network = network;
         this.transaction = transaction;
         this.balanceChange = balanceChange;
-        final MonetaryFormat monetaryFormatter = network.getParams().getMonetaryFormat();
-        dateFormat = DateFormat.getDateTimeInstance(DateFormat.SHORT, DateFormat.SHORT);
+        final String formattedDate;
+        synchronized (DATE_FORMAT) {
+            formattedDate = DATE_FORMAT.format(transaction.getUpdateTime());
+        }
         networkNameProperty = new SimpleStringProperty(NetworkResolver.getName(network.getParams()));
-        dateProperty = new SimpleStringProperty(dateFormat.format(transaction.getUpdateTime()));
-        amountProperty = new SimpleStringProperty(monetaryFormatter.format(balanceChange).toString());
+        dateProperty = new SimpleStringProperty(formattedDate);
+        amountProperty = new SimpleStringProperty(network.format(balanceChange).toString());
         memoProperty = new SimpleStringProperty(transaction.getMemo());
         memoProperty.addListener(change -> {
             transaction.setMemo(memoProperty.getValue());
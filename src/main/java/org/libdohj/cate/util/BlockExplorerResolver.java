@@ -1,8 +1,10 @@
 package org.libdohj.cate.util;
 
-import org.libdohj.cate.controller.MainController;
 import org.libdohj.cate.controller.WalletTransaction;
 
+import java.util.EnumMap;
+import java.util.Map;
+
 /**
  * Created by maxke on 13.01.2016.
  * Finds an URL to call to show a certain transaction on a block explorer website
@@ -18,17 +20,27 @@ public class BlockExplorerResolver {
     private static final String CHAINSO_PATH_LTCTEST = "LTCTEST/";
     private static final String CHAINSO_PATH_DOGETEST = "DOGETEST/";
 
+    /**
+     * Complete transaction URL prefixes per network, assembled once at class
+     * load so building a URL is a lookup plus one concatenation.
+     */
+    private static final Map<NetworkResolver.NetworkCode, String> CHAINSO_TX_PREFIXES
+            = new EnumMap<>(NetworkResolver.NetworkCode.class);
+
+    static {
+        for (NetworkResolver.NetworkCode code : NetworkResolver.NetworkCode.values()) {
+            CHAINSO_TX_PREFIXES.put(code, CHAINSO_BASE_URL + CHAINSO_PATH_TX + networkCodeToPath(code));
+        }
+    }
+
     public static String getUrl(WalletTransaction wtx) {
         // TODO: This should take into account a setting the user can make for the explorer to use.
         return getChainSoUrl(wtx);
     }
 
     public static String getChainSoUrl(WalletTransaction wtx) {
-        StringBuilder sb = new StringBuilder(CHAINSO_BASE_URL);
-        sb.append(CHAINSO_PATH_TX);
-        sb.append(networkCodeToPath(NetworkResolver.getCode(wtx.getParams())));
-        sb.append(wtx.getTransaction().getHashAsString());
-        return sb.toString();
+        return CHAINSO_TX_PREFIXES.get(NetworkResolver.getCode(wtx.getParams()))
+                + wtx.getTransaction().getHashAsString();
     }
 
     private static String networkCodeToPath(NetworkResolver.NetworkCode code) {
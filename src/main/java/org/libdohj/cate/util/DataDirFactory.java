@@ -46,7 +46,7 @@ public class DataDirFactory {
         dataDir = new File(path);
 
         if (!dataDir.exists())
-            dataDir.mkdir();
+            dataDir.mkdirs();
 
         return dataDir;
     }
@@ -8,7 +8,6 @@ import org.libdohj.params.DogecoinTestNet3Params;
 import org.libdohj.params.LitecoinMainNetParams;
 
 import java.util.LinkedHashMap;
-import java.util.ResourceBundle;
 import java.util.Set;
 
 /**
@@ -4,7 +4,9 @@ import org.bitcoinj.core.TransactionOutput;
 import org.libdohj.cate.controller.MainController;
 
 import java.util.ArrayList;
+import java.util.HashSet;
 import java.util.List;
+import java.util.Set;
 import java.util.stream.Collectors;
 import org.libdohj.cate.controller.WalletTransaction;
 
@@ -28,8 +30,13 @@ public class TransactionFormatter {
             outputs.addAll(wtx.getTransaction().getWalletOutputs(wtx.getNetwork().wallet()));
         } else {
             // We sent coins, so use that output we actually sent to. We need to filter out a possible change output
-            outputs.addAll(wtx.getTransaction().getOutputs());
-            outputs.removeAll(wtx.getTransaction().getWalletOutputs(wtx.getNetwork().wallet()));
+            final Set<TransactionOutput> walletOutputs
+                    = new HashSet<>(wtx.getTransaction().getWalletOutputs(wtx.getNetwork().wallet()));
+            for (TransactionOutput output : wtx.getTransaction().getOutputs()) {
+                if (!walletOutputs.contains(output)) {
+                    outputs.add(output);
+                }
+            }
         }
 
         return outputs;
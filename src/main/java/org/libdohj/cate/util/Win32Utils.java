@@ -42,7 +42,7 @@ public class Win32Utils {
                 Ole32.INSTANCE.CoTaskMemFree(ppszPath.getValue());
             }
         } else {
-            logger.log(Level.SEVERE, null, "Could not determine local application data directory: " + hResult);
+            logger.log(Level.SEVERE, "Could not determine local application data directory: {0}", hResult);
         }
 
         return appDataDir;
@@ -53,17 +53,9 @@ public class Win32Utils {
      * @param ppszPath pointer to the string to convert.
      */
     public static String nullTerminatedToString(PointerByReference ppszPath) {
-        char delim = '\0';
-        char[] chars = ppszPath.getValue().getCharArray(0, Shell32.MAX_PATH);
-        int charIdx;
-
-        for (charIdx = 0; charIdx < chars.length; charIdx++) {
-            if (chars[charIdx] == delim) {
-                break;
-            }
-        }
-
-        return new String(chars, 0, charIdx);
+        // JNA reads up to the null terminator natively, so there is no need
+        // to copy out MAX_PATH characters and scan for the delimiter here.
+        return ppszPath.getValue().getWideString(0);
     }
 
     private static final Map<String, Object> LOAD_LIBRARY_OPTIONS = new HashMap<>();